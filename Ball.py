@@ -19,7 +19,10 @@ corner of the image. The x and y values are always relative to the top left
 corner of the game screen itself, which is defined to be at x=0, y=0.
 
 The velocity is a Vector2 value in pixels per millisecond (ppm), with a unit
-vector pointing 1 ppm to the right and 1 ppm down (↘).
+vector pointing 1 ppm to the right and 1 ppm down (↘). Internally, the two
+components are held as plain floats so that the per-frame movement math does
+not have to go through a Vector2 object. The velocity property builds a
+Vector2 from them only when outside code asks for it.
 
 Although the game starts with a single ball, this class is NOT designed as a
 singleton, allowing for the possibility of multiple balls in future updates.
@@ -35,6 +38,7 @@ from typing import override
 from ControllerInput import ControllerInput
 from arcade_tools.GameElement import GameElement
 from Paddle import Paddle
+import images
 
 _BALL_IMAGE_FILE="./images/football.png"
 _INITIAL_BALL_SPEED_PPM = 0.25
@@ -43,8 +47,120 @@ _MAX_SERVE_ANGLE_DEGREES = 60
 _PADDLE_TO_BALL_HORIZONTAL_VELOCITY_TRANSFER_RATIO = 0.10
 _SPEED_INCREASE_RATIO_AFTER_OBJECT_HIT = 1.01
 
+_MIN_SERVE_ANGLE_DEGREES = 15
+
+_SERVE_VELOCITIES = tuple(
+    (
+        -_INITIAL_BALL_SPEED_PPM * math.sin(math.radians(serve_angle_degrees)),
+        _INITIAL_BALL_SPEED_PPM * math.cos(math.radians(serve_angle_degrees))
+    )
+    for serve_angle_degrees in (
+        math.copysign(max(abs(random_angle_degrees), _MIN_SERVE_ANGLE_DEGREES), random_angle_degrees)
+        for random_angle_degrees in range(-_MAX_SERVE_ANGLE_DEGREES, _MAX_SERVE_ANGLE_DEGREES)
+    )
+)
+"""
+The (vx, vy) velocities, in ppm, that the ball can be served with. There is
+one entry for each whole angle in the range
+[-_MAX_SERVE_ANGLE_DEGREES, _MAX_SERVE_ANGLE_DEGREES), so picking an entry at
+random is the same as picking a random serve angle.
+
+Angles closer to straight down than _MIN_SERVE_ANGLE_DEGREES are pushed out to
+that minimum. It can be a little tricky to get the ball to deflect to the side
+off of the paddle, especially if the user does not realize there is a way to
+do it, so the ball is never served straight down.
+
+The ball is served straight down, (0, _INITIAL_BALL_SPEED_PPM), rotated by the
+serve angle, which simplifies to the values above. All of this is worked out
+once here rather than on every serve.
+"""
+
+
+def _reflect(vx: float, vy: float,
+             ball_left: float, ball_top: float, ball_right: float, ball_bottom: float,
+             other_left: float, other_top: float, other_right: float, other_bottom: float,
+             other_vx: float) -> tuple[float, float]:
+    """
+    The math behind Ball.collided_with(), kept as a module level function that
+    only deals with plain numbers so that it does not depend on any pygame
+    objects. This is intended to be used internally only.
+
+    The ball will bounce away from the edge(s) of the other element that it
+    just hit, pick up a portion of the other element's horizontal velocity and
+    speed up slightly.
+
+    :param vx: The x velocity of the ball in ppm.
+    :param vy: The y velocity of the ball in ppm.
+    :param ball_left: The left edge of the ball. The other ball_ parameters
+                        are the rest of its edges.
+    :param other_left: The left edge of the other element. The other other_
+                        parameters are the rest of its edges.
+    :param other_vx: The x velocity of the other element in ppm.
+    :return: The new (vx, vy) velocity of the ball.
+    """
+    # Completely enclosed
+    if (other_left <= ball_left and ball_right <= other_right
+            and other_top <= ball_top and ball_bottom <= other_bottom):
+        vy = abs(vy)
+    else:
+        # bottom
+        if ball_bottom > other_bottom:
+            vy = abs(vy)
+        # top
+        elif ball_top < other_top:
+            vy = -abs(vy)
+        # right
+        if ball_right > other_right:
+            vx = abs(vx)
+        # left
+        elif ball_left < other_left:
+            vx = -abs(vx)
+
+    # Transfer a small amount of the x velocity of the other element to the ball.
+    vx += _PADDLE_TO_BALL_HORIZONTAL_VELOCITY_TRANSFER_RATIO * other_vx
+
+    #
+    # Speed up the ball slightly. Scaling both components by the same ratio
+    # scales the speed by exactly that ratio, so there is no need to work out
+    # the length of the velocity first.
+    #
+    vx *= _SPEED_INCREASE_RATIO_AFTER_OBJECT_HIT
+    vy *= _SPEED_INCREASE_RATIO_AFTER_OBJECT_HIT
+
+    #
+    # Lastly, if the y velocity should ever be nearly 0,
+    # it could be impossible for the ball to move. If, somehow,
+    # is condition were to occur, raise the velocity to the
+    # minimum amount in the direction of motion or down, if there
+    # is exactly 0 velocity in the y direction.
+    #
+    if -_MINIMUM_BALL_Y_VELOCITY_PPM < vy < _MINIMUM_BALL_Y_VELOCITY_PPM:
+        vy = -_MINIMUM_BALL_Y_VELOCITY_PPM if vy < 0 else _MINIMUM_BALL_Y_VELOCITY_PPM
+    # TODO - Except for the speed up, these reflection calculations are generic for an elastic ball colliding with an immovable other element
+
+    return vx, vy
+
 
 class Ball(GameElement):
+    #
+    # Give the attributes that every Ball has fixed slots. Note that the
+    # GameElement base class does not define __slots__, so each Ball still
+    # has an instance __dict__ and this does not save any memory.
+    #
+    __slots__ = (
+        "_controller_input",
+        "_is_served",
+        "_serve",
+        "_paddle",
+        "_starting_x",
+        "_starting_y",
+        "_x",
+        "_y",
+        "_vx",
+        "_vy",
+        "_screen_id",
+        "_screen_edges",
+    )
 
     def __init__(self, x: int, y: int, paddle: Paddle):
         """
@@ -71,9 +187,12 @@ class Ball(GameElement):
         #
         # Grab a local pointer to the singleton ControllerInput object so that
         # it does not need to be re-created everytime the update() method is
-        # called. This is used to see if the serve button has been pressed.
+        # called. This is used to see if the serve button has been pressed,
+        # so its bound serve() method is saved off as well to save looking it
+        # up on every frame.
         #
         self._controller_input = ControllerInput()
+        self._serve = self._controller_input.serve
 
         #
         # Save off the paddle pointer for use in collision detection
@@ -81,11 +200,11 @@ class Ball(GameElement):
         self._paddle = paddle
 
         #
-        # Record that this ball has not yet been served and should not
-        # be moving. Since velocity has floating point components, the code
-        # cannot rely on it being (0, 0) to know that it is stopped.
+        # The ball starts out waiting to be served and should not be moving.
+        # Since velocity has floating point components, the code cannot rely
+        # on it being (0, 0) to know that it is stopped, so a flag is kept.
         #
-        self._has_been_served = False
+        self._is_served = False
 
         #
         # Record the starting position
@@ -93,13 +212,63 @@ class Ball(GameElement):
         self._starting_x = x
         self._starting_y = y
 
+        #
+        # The position of the top left corner of the ball, kept as floats.
+        # The Rect that the ball is can only hold whole pixels, so moving it
+        # by a fraction of a pixel each update would lose the fraction every
+        # time. Instead, the ball is moved using these values and the Rect is
+        # set from them.
+        #
+        self._x = float(x)
+        self._y = float(y)
+
+        #
+        # The x and y components of the velocity, in ppm. These are the values
+        # that are actually used for all the movement and collision math. The
+        # velocity property wraps them in a Vector2 for outside code.
+        #
+        self._vx = 0.0
+        self._vy = 0.0
+
+        #
+        # The (left, top, right, bottom) edges of the screen the ball was last
+        # updated on, along with the id() of that screen. The screen does not
+        # change size during the game, so the edges are only looked up again
+        # if a different screen is passed to update().
+        #
+        self._screen_id = 0
+        self._screen_edges = None
+
         #
         # Finally, initialize the base GameElement class items.
         #
         # The velocity of a GameElement defaults to (0, 0), but set it here
         # to be explicit and to guarantee that it is not moving when created.
         #
-        super().__init__(_BALL_IMAGE_FILE, x=x, y=y, velocity=Vector2(0, 0))
+        super().__init__(images.load(_BALL_IMAGE_FILE), x=x, y=y, velocity=Vector2(0, 0))
+
+    @property
+    def velocity(self) -> Vector2:
+        """
+        The velocity of the ball as a Vector2. A new Vector2 is built every
+        time this is read, so changing its components does NOT change the
+        velocity of the ball. Assign a new value to do that instead.
+        """
+        return Vector2(self._vx, self._vy)
+
+    @velocity.setter
+    def velocity(self, velocity: Vector2):
+        self._vx = float(velocity.x)
+        self._vy = float(velocity.y)
+
+    @property
+    def velocity_components(self) -> tuple[float, float]:
+        """
+        The (x, y) components of the velocity of the ball, in ppm. This is the
+        same as velocity, but without building a Vector2, for code that only
+        needs the numbers.
+        """
+        return self._vx, self._vy
 
     @override
     def update(self, dt: int, screen: Surface = None, **kwargs):
@@ -118,37 +287,46 @@ class Ball(GameElement):
         :param kwargs: Any other key word arguments, such as events, are
                         ignored by this method.
         """
-        # Check that required parameters have been supplied
-        assert screen is not None , f"INTERNAL ERROR: A screen parameter MUST be supplied to the {self.__class__.__name__}.update() method"
-
-        if not self._has_been_served:
-            """
-            Check if the serve button has been hit. If so, then change the
-            state to serve the ball and continue on with the rest of the
-            update code. If not, then just return since there is nothing
-            to update.
-            """
-            if self._controller_input.serve():
-                self._has_been_served = True
-                self.velocity = Vector2(0.0, _INITIAL_BALL_SPEED_PPM)
-                #
-                # Randomly deflect the ball in the x direction and make sure
-                # that it is not moving straight down because it can be a
-                # little tricky to get it to deflect to the side off of the
-                # paddle, especially if the user does not realize there is a
-                # way to do it.
-                #
-                serve_angle_degrees = random.randrange(-_MAX_SERVE_ANGLE_DEGREES, _MAX_SERVE_ANGLE_DEGREES)
-                if abs(serve_angle_degrees) < 15:
-                    serve_angle_degrees = math.copysign(15, serve_angle_degrees)
-                self.velocity.rotate_ip(serve_angle_degrees)
-            else:
+        #
+        # If the ball has not been served, check if the serve button has been
+        # hit. If so, then serve the ball and carry on with the moving code
+        # below. If not, then just return since there is nothing to update.
+        #
+        if not self._is_served:
+            if not self._serve():
                 return
 
+            #
+            # Check that required parameters have been supplied. The screen is
+            # only used once the ball is moving, so this is checked once per
+            # serve rather than on every frame.
+            #
+            assert screen is not None , f"INTERNAL ERROR: A screen parameter MUST be supplied to the {self.__class__.__name__}.update() method"
+
+            # Randomly deflect the ball in the x direction
+            self._vx, self._vy = random.choice(_SERVE_VELOCITIES)
+            self._is_served = True
+
+        #
+        # Do all the per-frame math on local copies of the position, the
+        # velocity and the ball's edges, rather than going back to the
+        # attributes on self for every comparison, and write the position and
+        # velocity back once at the end.
+        #
+        vx = self._vx
+        vy = self._vy
+
         # Update the ball's position
-        self.move_ip(self.velocity.x * dt, self.velocity.y * dt)
+        x = self._x + vx * dt
+        y = self._y + vy * dt
+        self.topleft = (int(x), int(y))
+        ball_left, ball_top, ball_right = self.left, self.top, self.right
 
-        screen_rect = screen.get_rect()
+        if id(screen) != self._screen_id:
+            screen_rect = screen.get_rect()
+            self._screen_edges = (screen_rect.left, screen_rect.top, screen_rect.right, screen_rect.bottom)
+            self._screen_id = id(screen)
+        screen_left, screen_top, screen_right, screen_bottom = self._screen_edges
 
         #
         # Check if the ball ran off the bottom of the screen
@@ -156,19 +334,42 @@ class Ball(GameElement):
         # that it can be seen falling off the screen.
         # The player loses a token every time this happens.
         #
-        if self.top > screen_rect.bottom:
+        # Once reset, there is nothing else to do, since the edges used by
+        # the wall checks below are from before the reset.
+        #
+        if ball_top > screen_bottom:
             self.topleft = (self._starting_x, self._starting_y)
-            self.velocity = Vector2(0, 0)
-            self._has_been_served = False
+            self._x = float(self._starting_x)
+            self._y = float(self._starting_y)
+            self._vx = 0.0
+            self._vy = 0.0
+            self._is_served = False
             Tokens.lose(1)
+            return
+
+        #
+        # Handle collisions with the sides and top of the screen. The ball is
+        # put back against the wall it went past, so that it does not end up
+        # partly off the screen, and it always ends up moving away from that
+        # wall, so it is enough to force the sign of the velocity for that axis.
+        #
+        if ball_left < screen_left:
+            x = float(screen_left)
+            self.left = screen_left
+            vx = abs(vx)
+        elif ball_right > screen_right:
+            x = float(screen_right - self.width)
+            self.right = screen_right
+            vx = -abs(vx)
+        if ball_top < screen_top:
+            y = float(screen_top)
+            self.top = screen_top
+            vy = abs(vy)
 
-        # Handle collisions with the sides and top of the screen
-        if self.left < screen_rect.left:
-            self.velocity.x = abs(self.velocity.x)
-        elif self.right > screen_rect.right:
-            self.velocity.x = -abs(self.velocity.x)
-        if self.top < screen_rect.top:
-            self.velocity.y = abs(self.velocity.y)
+        self._x = x
+        self._y = y
+        self._vx = vx
+        self._vy = vy
 
     @override
     def collided_with(self, other_element: GameElement):
@@ -184,39 +385,16 @@ class Ball(GameElement):
         Also, everytime the ball hits an object, any object, it speeds up
         slightly. This makes the game more challenging as time goes on.
         """
-        # Completely enclosed
-        if other_element.contains(self):
-            self.velocity.y = abs(self.velocity.y)
-        else:
-            # bottom
-            if self.bottom > other_element.bottom:
-                self.velocity.y = abs(self.velocity.y)
-            # top
-            elif self.top < other_element.top:
-                self.velocity.y = -abs(self.velocity.y)
-            # right
-            if self.right > other_element.right:
-                self.velocity.x = abs(self.velocity.x)
-            # left
-            elif self.left < other_element.left:
-                self.velocity.x = -abs(self.velocity.x)
-
-        # Transfer a small amount of the x velocity of the other_object to the ball.
-        self.velocity.x += _PADDLE_TO_BALL_HORIZONTAL_VELOCITY_TRANSFER_RATIO * other_element.velocity.x
-
-        # Speed up the ball slightly
-        self.velocity.scale_to_length(self.velocity.length() * _SPEED_INCREASE_RATIO_AFTER_OBJECT_HIT)
-
-        #
-        # Lastly, if the y velocity should ever be nearly 0,
-        # it could be impossible for the ball to move. If, somehow,
-        # is condition were to occur, raise the velocity to the
-        # minimum amount in the direction of motion or down, if there
-        # is exactly 0 velocity in the y direction.
-        #
-        if -_MINIMUM_BALL_Y_VELOCITY_PPM < self.velocity.y < _MINIMUM_BALL_Y_VELOCITY_PPM:
-            self.velocity.y = -_MINIMUM_BALL_Y_VELOCITY_PPM if self.velocity.y < 0 else _MINIMUM_BALL_Y_VELOCITY_PPM
-        # TODO - Except for the speed up, these reflection calculations are generic for an elastic self colliding with an immovable other_element
+        #
+        # The enclosed check is done on the edges in _reflect() rather than
+        # with other_element.contains(self), so each edge is only fetched
+        # from the Rects once.
+        #
+        self._vx, self._vy = _reflect(
+            self._vx, self._vy,
+            self.left, self.top, self.right, self.bottom,
+            other_element.left, other_element.top, other_element.right, other_element.bottom,
+            other_element.velocity.x)
 
     #
     # GameElement's draw() method is sufficient for Ball objects, so that is NOT overridden
@@ -23,50 +23,71 @@ from pygame import Vector2
 from typing import override
 
 from arcade_tools.GameElement import GameElement
+import images
 import score
 
 _BRICK_IMAGE_FILE="./images/brick.png"
+_ZERO_VELOCITY = Vector2(0, 0)
+"""
+The velocity shared by every brick. Bricks never move, so rather than creating
+a new Vector2 for each one, they all use this one. Nothing should ever change
+it.
+"""
 
 
 class Brick(GameElement):
-
-    was_hit = False
-    """
-    This becomes set to True if this brick has been hit by the ball.
-    This value should not be written by any other code, but should be read to
-    see if references to this object should be dropped so that the brick
-    is no longer displayed and the memory used by this object can be freed.
-    """
+    #
+    # Give the attributes that every Brick has fixed slots. Note that the
+    # GameElement base class does not define __slots__, so each Brick still
+    # has an instance __dict__ and this does not save any memory. The slots
+    # mainly document the attributes that a Brick adds:
+    #
+    #   was_hit - This becomes set to True if this brick has been hit by the
+    #             ball. This value should not be written by any other code,
+    #             but should be read to see if references to this object
+    #             should be dropped so that the brick is no longer displayed
+    #             and the memory used by this object can be freed.
+    #   _base_value - The base number of points that this brick is worth.
+    #
+    __slots__ = (
+        "was_hit",
+        "_base_value",
+    )
 
     def __init__(self, x: int = 0, y: int = 0):
         """
-        Other than making sure pygame has been initialized and supplying
-        the image file name, the parent GameElement __init__ method does
+        Other than checking that pygame has been initialized and supplying
+        the image, the parent GameElement __init__ method does
         everything that is required to create a Brick.
         """
         #
-        # Make sure pygame is initialized. Normally, this is expected to be
-        # done before elements are created, so issue a warning if it had to
-        # be done here.
+        # Make sure pygame is initialized. This is expected to be done before
+        # elements are created. Bricks are created in bulk, so unlike the
+        # other elements this is only checked with an assert, which is
+        # dropped entirely when running with python -O.
         #
-        if not pygame.get_init():
-            print(
-                f"WARNING: pygame was not initialized when a {self.__class__.__name__} object was instantiated. It has now been initialized, but pygame.init() should normally be called before instantiating any instances of the {self.__class__.__name__} class.")
-            pygame.init()
+        assert pygame.get_init(), f"INTERNAL ERROR: pygame.init() must be called before instantiating any instances of the {self.__class__.__name__} class"
 
         #
         # Initialize the base GameElement class items.
         #
+        # All bricks share the same image, so it is passed in as the already
+        # loaded Surface rather than as the file name. That way the image file
+        # is only read and converted once instead of once per brick.
+        #
         # The velocity of a GameElement defaults to (0, 0), but set it here
         # to be explicit and to guarantee that it is not moving when created.
         #
-        super().__init__(_BRICK_IMAGE_FILE, x=x, y=y, velocity=Vector2(0, 0))
+        super().__init__(images.load(_BRICK_IMAGE_FILE), x=x, y=y, velocity=_ZERO_VELOCITY)
 
         #
         # Right now, all bricks have the same base value
         #
         self._base_value = 1
 
+        # A new brick has not been hit yet
+        self.was_hit = False
+
     @override
     def update(self, *args, **kargs):
         """
@@ -83,11 +104,13 @@ class Brick(GameElement):
         collide with a brick is the ball. In the game, when that happens,
         the brick should disappear. In this code, Set the was_hit attribute so
         that the main game loop can drop the reference to this object so it
-        can be deleted and no longer displayed.
+        can be deleted and no longer displayed. Since it is always the ball,
+        its velocity is read with Ball.velocity_components.
         """
         self.was_hit = True
 
-        score.brick_destroyed( self._base_value, other_element.velocity)
+        ball_vx, ball_vy = other_element.velocity_components
+        score.brick_destroyed(self._base_value, ball_vx, ball_vy)
 
     #
     # GameElement's draw() method is sufficient for Brick objects, so that is NOT overridden
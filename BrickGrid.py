@@ -0,0 +1,86 @@
+"""
+BrickGrid
+
+A BrickGrid splits the screen into a grid of equally sized cells and keeps
+track of which bricks are in which cell. This allows the game loop to only
+check the ball for collisions against the few bricks that are near it,
+rather than against every brick on the screen.
+
+The grid is intended to line up with the way the bricks are laid out, so that
+each brick fits entirely inside a single cell. Typically, this means that
+the grid starts at the top left corner of the set of bricks and that the
+cells are the size of a brick plus the gap between bricks.
+
+All x and y values are in pixels and are relative to the top left corner of
+the game screen itself, which is defined to be at x=0, y=0.
+"""
+from pygame import Rect
+
+from Brick import Brick
+
+
+class BrickGrid:
+
+    def __init__(self, x: int, y: int, cell_width: int, cell_height: int):
+        """
+        :param x: The x position of the left edge of the first column of cells.
+        :param y: The y position of the top edge of the first row of cells.
+        :param cell_width: The width of each cell.
+        :param cell_height: The height of each cell.
+        """
+        self._x = x
+        self._y = y
+        self._cell_width = cell_width
+        self._cell_height = cell_height
+
+        #
+        # The bricks in each cell, keyed by the (column, row) of the cell.
+        # Cells with no bricks in them do not have an entry.
+        #
+        self._cells: dict[tuple[int, int], list[Brick]] = {}
+
+    def _cell_of(self, x: int, y: int) -> tuple[int, int]:
+        """
+        The (column, row) of the cell containing the given point. This is
+        intended to be used internally only.
+        """
+        return (x - self._x) // self._cell_width, (y - self._y) // self._cell_height
+
+    def add(self, brick: Brick):
+        """
+        Add a brick to the cell that it is in. The whole brick must fit inside
+        a single cell.
+        """
+        cell = self._cell_of(brick.left, brick.top)
+        assert cell == self._cell_of(brick.right - 1, brick.bottom - 1), f"INTERNAL ERROR: The brick at {brick.topleft} does not fit inside a single {self.__class__.__name__} cell"
+        self._cells.setdefault(cell, []).append(brick)
+
+    def remove(self, brick: Brick):
+        """
+        Remove a brick from the grid. This is expected to be called when a
+        brick has been hit and is being removed from the game.
+        """
+        cell = self._cell_of(brick.left, brick.top)
+        #
+        # Rects compare equal if they have the same position and size, so
+        # the brick is matched on identity rather than using list.remove().
+        #
+        remaining_bricks = [b for b in self._cells.get(cell, []) if b is not brick]
+        if remaining_bricks:
+            self._cells[cell] = remaining_bricks
+        else:
+            self._cells.pop(cell, None)
+
+    def bricks_near(self, rect: Rect) -> list[Brick]:
+        """
+        All the bricks in the cells that the given rect overlaps. Any brick
+        that the rect collides with is guaranteed to be in this list, but
+        not every brick in the list necessarily collides with it.
+        """
+        first_column, first_row = self._cell_of(rect.left, rect.top)
+        last_column, last_row = self._cell_of(rect.right - 1, rect.bottom - 1)
+        bricks = []
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                bricks.extend(self._cells.get((column, row), ()))
+        return bricks
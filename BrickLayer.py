@@ -0,0 +1,60 @@
+"""
+BrickLayer
+
+Bricks never move, so rather than blitting every brick on to the screen on
+every frame, the BrickLayer draws all the bricks that are still in play on to
+a single Surface once, and then that one Surface is blitted on to the screen
+each frame. When a brick is removed, just the area it covered on the layer is
+cleared.
+
+The layer covers the whole screen and is the black background of the game
+everywhere that there is no brick. Drawing it replaces clearing the screen at
+the start of each frame, so it should be drawn before anything else. Since it
+is fully opaque, it is blitted as a straight copy with no alpha blending.
+
+All x and y values are in pixels and are relative to the top left corner of
+the game screen itself, which is defined to be at x=0, y=0.
+"""
+from pygame import Rect
+from pygame import Surface
+
+from Brick import Brick
+
+_BACKGROUND_COLOR = (0, 0, 0)
+
+
+class BrickLayer:
+
+    def __init__(self, size: tuple[int, int], bricks: list[Brick]):
+        """
+        Create the layer and draw the given bricks on to it.
+
+        :param size: The (width, height) of the game screen.
+        :param bricks: The full set of bricks at the start of the level.
+        """
+        self._surface = Surface(size).convert()
+        self.rebuild(bricks)
+
+    def rebuild(self, bricks: list[Brick]):
+        """
+        Redraw the whole layer with just the given bricks on it.
+
+        :param bricks: The bricks that are still in play.
+        """
+        self._surface.fill(_BACKGROUND_COLOR)
+        self._surface.blits([(brick.image, brick.topleft) for brick in bricks], doreturn=False)
+
+    def remove(self, brick: Brick):
+        """
+        Clear the area of the layer where the given brick was drawn. This is
+        expected to be called when a brick has been hit and is being removed
+        from the game.
+        """
+        self._surface.fill(_BACKGROUND_COLOR, Rect(brick))
+
+    def draw(self, screen: Surface):
+        """
+        Draw the background, with all the bricks in the layer on it, on to the
+        screen.
+        """
+        screen.blit(self._surface, (0, 0))
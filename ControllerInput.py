@@ -12,6 +12,9 @@ without having to pass the single instance around everywhere.
 This class is specific for the breaking-bricks game.
 """
 import pygame
+from pygame import K_LEFT
+from pygame import K_RIGHT
+from pygame import K_SPACE
 
 from controller_config import _button_mapping
 
@@ -47,6 +50,15 @@ class ControllerInput:
             # Now initialize the _joysticks list.
             #
             self._joysticks = []
+
+            #
+            # A (joystick, paddle axis, serve button) entry for each joystick,
+            # where the axis and button are the indices to read on that
+            # joystick. The mapping for a joystick cannot change while the
+            # game is running, so it is looked up once here rather than on
+            # every read.
+            #
+            self._joystick_mappings = []
             num_joysticks = pygame.joystick.get_count()
             if pygame.joystick.get_count() > 0:
                 print(f"Found {num_joysticks} joysticks")
@@ -102,6 +114,8 @@ class ControllerInput:
                         error_message += ' does not have an "button" entry in its "serve" entry.'
                         raise RuntimeError(error_message)
 
+                    self._joystick_mappings.append((joystick, button_mapping["paddle"]["axis"], button_mapping["serve"]["button"]))
+
             self._is_initialized = True
 
     def paddle(self) -> float:
@@ -128,21 +142,16 @@ class ControllerInput:
         # First, address the keyboard
         #
         keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT]:
+        if keys[K_LEFT]:
             movement -= 1.0
-        if keys[pygame.K_RIGHT]:
+        if keys[K_RIGHT]:
             movement += 1.0
 
         #
         # Now, look at any joysticks.
         #
-        for joystick in self._joysticks:
-            guid = joystick.get_guid()
-            if guid in _button_mapping:
-                button_mapping = _button_mapping[guid]
-            else:
-                button_mapping = _button_mapping["default"]
-            movement += joystick.get_axis(button_mapping["paddle"]["axis"])
+        for joystick, paddle_axis, _ in self._joystick_mappings:
+            movement += joystick.get_axis(paddle_axis)
 
         #
         # Finally, clip the resulting movement value so that is in the range [-1.0, 1.0],
@@ -159,17 +168,12 @@ class ControllerInput:
         """
         # Keyboard
         keys = pygame.key.get_pressed()
-        if keys[pygame.K_SPACE]:
+        if keys[K_SPACE]:
             return True
 
         # Joysticks
-        for joystick in self._joysticks:
-            guid = joystick.get_guid()
-            if guid in _button_mapping:
-                button_mapping = _button_mapping[guid]
-            else:
-                button_mapping = _button_mapping["default"]
-            if abs(joystick.get_button(button_mapping["serve"]["button"])) > 0.5:
+        for joystick, _, serve_button in self._joystick_mappings:
+            if abs(joystick.get_button(serve_button)) > 0.5:
                 return True
 
         return False
@@ -188,8 +192,8 @@ class ControllerInput:
         # Keyboard
         keys = pygame.key.get_pressed()
         text_lines.append(f"Keyboard:")
-        text_lines.append(f"  Left Arrow: {keys[pygame.K_LEFT]}")
-        text_lines.append(f"  Right Arrow: {keys[pygame.K_RIGHT]}")
+        text_lines.append(f"  Left Arrow: {keys[K_LEFT]}")
+        text_lines.append(f"  Right Arrow: {keys[K_RIGHT]}")
 
         # Joysticks
         for joystick in self._joysticks:
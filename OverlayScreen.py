@@ -1,22 +1,78 @@
+from functools import lru_cache
 import pygame
+from pygame import Rect
 from pygame import Surface
+from pygame.font import Font
 from pygame.color import Color
 from pygame.math import Vector2
 from typing import override
 
 from arcade_tools.GameElement import GameElement
 
+_font = None
+"""
+The font used for the message. Looking up a system font can mean scanning the
+fonts on the system, so this is only done the first time it is needed by
+_get_font(). This is intended to be used internally only.
+"""
+
+
+def _get_font() -> Font:
+    """
+    Get the font used for the message, creating it on the first call. This is
+    intended to be used internally only.
+    """
+    global _font
+    if _font is None:
+        _font = pygame.font.SysFont("Arial", 72, bold=True)
+    return _font
+
+
+@lru_cache(maxsize=8)
+def _build_overlay(size: tuple[int, int], message: str) -> tuple[Surface, Surface, Rect]:
+    """
+    Build the images for an overlay on a screen of the given size with the
+    given message on it. The images only depend on these two values, so the
+    result is cached and the same Surfaces are handed back if the same
+    overlay is asked for again. This is intended to be used internally only.
+
+    The overlay is made of two parts. The first is a black shade that covers
+    the whole screen and is made translucent with a surface wide alpha value.
+    SDL blits that faster than a Surface with an alpha value in every pixel,
+    and it does not need every pixel filled in with an alpha value either.
+    The catch is that the surface wide alpha also applies to anything drawn
+    on to the shade, so the second part, the message text, is kept separate
+    to be drawn on top of it.
+
+    :param size: The (width, height) of the game screen.
+    :param message: The message to be displayed.
+    :return: The (shade, text, text_rect) where the text_rect is where the
+                text should be drawn to be centered on the screen.
+    """
+    # Create the semi-transparent shade. A new Surface is already all black.
+    shade = Surface(size).convert()
+    shade.set_alpha(128)  # Black with 50% transparency
+
+    # Create the message text centered on the screen
+    width, height = size
+    text = _get_font().render(message, True, Color("white"))
+    text_rect = text.get_rect()
+    text_rect.center = (width // 2, height // 2)
+
+    return shade, text, text_rect
+
 
 class OverlayScreen(GameElement):
     """
     OverlayScreen is a GameElement that is instantiated when the player has
     either cleared a level by breaking all the bricks, or has run out of
-    tokens. It is intended to exist as the last element in the list of game
-    elements so that it gets drawn last. It will place a translucent overlay
-    on the game screen so that what is drawn there is "greyed out", and then
-    will display the words "Game Over" or "You Won!" on to of it. Eventually,
-    when there is more than one level, "You Won!" will be replaced with
-    "Level Cleared!".
+    tokens. It never moves or changes, so it is kept with the other static
+    elements, which are only drawn and never updated, and are drawn after all
+    of the game elements so that it ends up on top. It will place a
+    translucent overlay on the game screen so that what is drawn there is
+    "greyed out", and then will display the words "Game Over" or "You Won!"
+    on to of it. Eventually, when there is more than one level, "You Won!"
+    will be replaced with "Level Cleared!".
     """
     def __init__(self, message: str, screen: Surface):
         """
@@ -31,23 +87,17 @@ class OverlayScreen(GameElement):
                                 During initialization, this is used to get the
                                 size of the screen.
         """
-        # Create the semi-transparent overlay
-        overlay = Surface(screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))  # RGBA: Black with 50% transparency
-
-        # Add the message text
-        font = pygame.font.SysFont("Arial", 72, bold=True)
-        text = font.render(message, True, Color("white"))
-        text_rect = text.get_rect()
-        text_rect.center = screen.get_rect().center
-        overlay.blit(text, text_rect)
+        shade, text, text_rect = _build_overlay(screen.get_size(), message)
 
         #
-        # Initialize the base GameElement class items. The overlay becomes the
+        # Initialize the base GameElement class items. The shade becomes the
         # image that is displayed at every frame.
         #
-        super().__init__(overlay, x=0, y=0, velocity=Vector2(0, 0), collidable=False)
+        super().__init__(shade, x=0, y=0, velocity=Vector2(0, 0), collidable=False)
 
+        # The message is drawn separately, on top of the shade
+        self._text = text
+        self._text_rect = text_rect
 
     @override
     def update(self, *args, **kargs):
@@ -65,7 +115,11 @@ class OverlayScreen(GameElement):
         """
         pass
 
-    #
-    # GameElement's draw() method is sufficient for the OverlayScreen screen, so it
-    # is used as is.
-    #
+    @override
+    def draw(self, screen: Surface):
+        """
+        Draw the shade with GameElement's draw() method and then draw the
+        message on top of it.
+        """
+        super().draw(screen)
+        screen.blit(self._text, self._text_rect)
@@ -23,83 +23,79 @@ the paddle itself, a velocity is not really needed. However, it is calculated
 and updated so that it can be transferred to the ball when the ball is hit.
 """
 import pygame
+from pygame import Rect
 from pygame import Surface
 from typing import override
 
 from arcade_tools.GameElement import GameElement
 from ControllerInput import ControllerInput
+import images
 
 _PADDLE_IMAGE_FILE="./images/paddle.png"
 _MAX_PADDLE_SPEED_PPM = 0.55
 
 
 class Paddle(GameElement):
-    # The single instance of the paddle. This is intended to be used internally only.
-    _instance = None
 
-    #
-    # A flag to make sure that later calls do not reset anything.
-    # This is intended to be used internally only.
-    #
-    _is_initialized = False
-
-    def __new__(cls, *args, **kwargs):
+    def __init__(self, x: int, y: int, screen: Surface):
         """
-        Make the Paddle a singleton class since there will only ever be one
-        of them. This also allows the ball class access the paddle when
-        checking if it collided with it.
-
-        TODO: Is there a way to not have multiple users of the paddle object?
+        In addition to the standard starting x and y coordinates, the
+        constructor also requires the screen that the paddle will be drawn on.
+        The screen does not change size during the game, so the area the
+        paddle is allowed to move in is worked out once here.
+
+        :param x:
+        :param y:
+        :param screen:
         """
-        if not cls._instance:
-            cls._instance = super().__new__(cls, *args, **kwargs)
-        return cls._instance
-
-    def __init__(self, x, y):
-        if not self._is_initialized:
-            #
-            # Make sure pygame is initialized. Normally, this is expected to be
-            # done before elements are created, so issue a warning if it had to
-            # be done here.
-            #
-            if not pygame.get_init():
-                print(f"WARNING: pygame was not initialized when a {self.__class__.__name__} object was instantiated. It has now been initialized, but pygame.init() should normally be called before instantiating any instances of the {self.__class__.__name__} class.")
-                pygame.init()
-
-            #
-            # Grab a local pointer to the singleton ControllerInput object so that
-            # it does not need to be re-created everytime the update() method is
-            # called.
-            #
-            self._controller_input = ControllerInput()
-
-            #
-            # Now, initialize the base GameElement class items.
-            #
-            super().__init__(_PADDLE_IMAGE_FILE, x=x, y=y)
-
-            #
-            # And set the self._is_initialized flag so later calls to get this
-            # singleton do not end up re-initializing the structures.
-            #
-            self._is_initialized = True
+        #
+        # Make sure pygame is initialized. Normally, this is expected to be
+        # done before elements are created, so issue a warning if it had to
+        # be done here.
+        #
+        if not pygame.get_init():
+            print(f"WARNING: pygame was not initialized when a {self.__class__.__name__} object was instantiated. It has now been initialized, but pygame.init() should normally be called before instantiating any instances of the {self.__class__.__name__} class.")
+            pygame.init()
+
+        #
+        # Grab a local pointer to the singleton ControllerInput object so that
+        # it does not need to be re-created everytime the update() method is
+        # called.
+        #
+        self._controller_input = ControllerInput()
+
+        #
+        # Now, initialize the base GameElement class items.
+        #
+        super().__init__(images.load(_PADDLE_IMAGE_FILE), x=x, y=y)
+
+        #
+        # The area the paddle is allowed to move in. This is as wide as the
+        # screen and covers just the row the paddle moves along.
+        #
+        screen_rect = screen.get_rect()
+        self._bounds = Rect(screen_rect.left, self.top, screen_rect.width, self.height)
 
     @override
-    def update(self, dt: int, screen: Surface = None, **kwargs):
+    def update(self, dt: int, **kwargs):
         """
         :param dt: The number of milliseconds since the last call to update.
                     This is used with any movement calculations to help
                     smooth and jitter in the frame rate.
-        :param screen: The screen the paddle will be drawn on. This is used to
-                        make sure the paddle does not go off the screen and
-                        MUST be supplied.
-        :param kwargs: Any other key word arguments, such as events, are
-                        ignored by this method.
+        :param kwargs: Any other key word arguments, such as events and the
+                        screen, are ignored by this method. The paddle is kept
+                        on the screen that was given to the constructor.
         """
-        # Check that required parameters have been supplied
-        assert screen is not None , f"INTERNAL ERROR: A screen parameter MUST be supplied to the {self.__class__.__name__}.update() method"
+        #
+        # When there is no input, the paddle is not moving and it is already
+        # within the screen from the last update, so there is nothing else to do.
+        #
+        paddle_input = self._controller_input.paddle()
+        if paddle_input == 0.0:
+            self.velocity.x = 0.0
+            return
 
-        self.velocity.x = self._controller_input.paddle() * _MAX_PADDLE_SPEED_PPM
+        self.velocity.x = paddle_input * _MAX_PADDLE_SPEED_PPM
         self.x += self.velocity.x * dt
 
         #
@@ -107,9 +103,7 @@ class Paddle(GameElement):
         # the paddle off the screen. If it does, put the paddle right at the
         # edge that it would have gone past.
         #
-        screen_rect = screen.get_rect()
-        self.left = max(self.left, screen_rect.left)
-        self.right = min(self.right, screen_rect.right)
+        self.clamp_ip(self._bounds)
 
     @override
     def collided_with(self, other_element: GameElement):
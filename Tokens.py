@@ -1,5 +1,6 @@
 import pygame
 from pygame import Surface
+import images
 from score import FONT_SIZE as SCORE_FONT_SIZE
 
 
@@ -21,7 +22,24 @@ class Tokens:
     _TOKEN_IMAGE_FILE = "./images/token.png"
     _STARTING_NUM_TOKENS = 3
     _MAX_TOKENS_BEFORE_STACKING = 10
+
+    #
+    # The scaled token image, its rect (which holds the y position of the
+    # tokens), and the most horizontal space the tokens are allowed to take up
+    # before they start to overlap. These are set up once by init() and are
+    # intended to be used internally only.
+    #
     _image = None
+    _image_rect = None
+    _max_space_for_all_tokens = 0
+
+    #
+    # The (image, position) pairs for each token to be drawn, ready to be
+    # passed to screen.blits(). This is set to None whenever the number of
+    # tokens changes so that it gets worked out again the next time the
+    # tokens are drawn. This is intended to be used internally only.
+    #
+    _blit_sequence = None
 
     num_tokens = _STARTING_NUM_TOKENS
     """
@@ -37,27 +55,43 @@ class Tokens:
     """
 
     @classmethod
-    def draw(cls, screen: Surface):
+    def init(cls, screen: Surface):
         """
-        Draw the current set of tokens in the bottom left of the screen.
+        Load the token image and work out everything about where the tokens
+        go that will never change. This must be called once, after the
+        display mode has been set and before the tokens are first drawn.
         """
         #
-        # Load the image and perform any calculations that will never change
-        # only once.
+        # smoothscale() makes a new Surface, so the shared image from the
+        # images module is not changed.
         #
-        if cls._image is None:
-            cls.image = pygame.image.load(cls._TOKEN_IMAGE_FILE).convert_alpha()
-            cls.image = pygame.transform.smoothscale(cls.image, (SCORE_FONT_SIZE, SCORE_FONT_SIZE))
-            cls.image_rect = cls.image.get_rect()
-            cls.image_rect.y = screen.get_height() - (2 * cls.image_rect.height)
-            cls.max_space_for_all_tokens = cls._MAX_TOKENS_BEFORE_STACKING * cls.image_rect.width
+        image = images.load(cls._TOKEN_IMAGE_FILE)
+        image = pygame.transform.smoothscale(image, (SCORE_FONT_SIZE, SCORE_FONT_SIZE))
+        cls._image_rect = image.get_rect()
+        cls._image_rect.y = screen.get_height() - (2 * cls._image_rect.height)
+        cls._max_space_for_all_tokens = cls._MAX_TOKENS_BEFORE_STACKING * cls._image_rect.width
+        cls._blit_sequence = None
+        cls._image = image
+
+    @classmethod
+    def draw(cls, screen: Surface):
+        """
+        Draw the current set of tokens in the bottom left of the screen.
 
-        if cls.num_tokens > 0:
-            x_offset_between_tokens = min(cls.max_space_for_all_tokens / cls.num_tokens, cls.image_rect.width)
+        The position of each token only changes when the number of tokens
+        does, so the positions are only worked out again then, and all the
+        tokens are drawn with a single call to screen.blits().
+        """
+        if cls._blit_sequence is None:
+            assert cls._image is not None, f"INTERNAL ERROR: {cls.__name__}.init() must be called before {cls.__name__}.draw()"
+            cls._blit_sequence = []
+            if cls.num_tokens > 0:
+                x_offset_between_tokens = min(cls._max_space_for_all_tokens / cls.num_tokens, cls._image_rect.width)
+                for token_index in range(cls.num_tokens):
+                    token_x = int(cls._image_rect.width + (token_index * x_offset_between_tokens))
+                    cls._blit_sequence.append((cls._image, (token_x, cls._image_rect.y)))
 
-            for token_index in range(cls.num_tokens):
-                cls.image_rect.x = cls.image_rect.width + (token_index * x_offset_between_tokens)
-                screen.blit(cls.image, cls.image_rect)
+        screen.blits(cls._blit_sequence, doreturn=False)
 
     @classmethod
     def add(cls, tokens_to_add: int = 1):
@@ -73,6 +107,7 @@ class Tokens:
         :param int tokens_to_add: The number of tokens to add. Defaults to 1.
         """
         cls.num_tokens += tokens_to_add
+        cls._blit_sequence = None
 
     @classmethod
     def lose(cls, tokens_to_remove: int = 1):
@@ -87,3 +122,4 @@ class Tokens:
         :param int tokens_to_remove: The number of tokens to remove. Defaults to 1.
         """
         cls.num_tokens = max(0, cls.num_tokens - tokens_to_remove)
+        cls._blit_sequence = None
@@ -0,0 +1,50 @@
+"""
+images
+
+Images used by the game elements are loaded through this module so that each
+image file is only read from disk, decoded and converted to the display's
+pixel format once, no matter how many elements use it. For example, every
+brick on the screen shares the same Surface.
+
+When an image is converted, images with no transparency at all are converted
+without alpha, which is the cheapest form to blit. Anything else keeps its
+per-pixel alpha.
+
+The Surfaces handed out are shared, so they should be treated as read only.
+Anything that needs to change an image should copy() it first.
+"""
+import pygame
+from pygame import Surface
+
+_cache: dict[str, Surface] = {}
+
+
+def _convert(image: Surface) -> Surface:
+    """
+    Convert a freshly loaded image to the display's pixel format, dropping the
+    alpha channel if every pixel is fully opaque. This is intended to be used
+    internally only.
+    """
+    width, height = image.get_size()
+    if pygame.mask.from_surface(image, 254).count() == width * height:
+        return image.convert()
+    return image.convert_alpha()
+
+
+def load(file_name: str) -> Surface:
+    """
+    Get the converted image for the given file, loading it the first time it
+    is asked for.
+
+    Because the image is converted to the display's pixel format, the display
+    mode must have been set with pygame.display.set_mode() before this is
+    called.
+
+    :param file_name: The path of the image file.
+    :return: The image as a Surface that is shared with all other callers.
+    """
+    image = _cache.get(file_name)
+    if image is None:
+        image = _convert(pygame.image.load(file_name))
+        _cache[file_name] = image
+    return image
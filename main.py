@@ -13,9 +13,14 @@ python main.py
 """
 import argparse
 import pygame
+from pygame import K_TAB
+from pygame import KEYDOWN
+from pygame import QUIT
 
 from Ball import Ball
 from Brick import Brick
+from BrickGrid import BrickGrid
+from BrickLayer import BrickLayer
 from ControllerInput import ControllerInput
 from OverlayScreen import OverlayScreen
 from Paddle import Paddle
@@ -29,25 +34,62 @@ parser = argparse.ArgumentParser(description="Run the Breaking Bricks game.")
 parser.add_argument('--num-brick-rows', type=int, default=5, help='The number of rows of bricks to start with. This is used for testing and should normally be left at the default of 5')
 parser.add_argument('--show-all-events', action='store_true', help='Show all Pygame events')
 args = parser.parse_args()
+show_all_events = args.show_all_events
 
 #
 # Init the pygame framework
 #
 pygame.init()
 
+#
+# Nothing in the game uses the mouse, and the joystick axes are read directly
+# by the ControllerInput rather than through events, so unless all the events
+# are being shown, have pygame drop these events rather than queue them up
+# only for them to be ignored. The joystick button events are still allowed
+# through, which keeps pygame updating the joystick state.
+#
+if not show_all_events:
+    pygame.event.set_blocked([
+        pygame.MOUSEMOTION,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEWHEEL,
+        pygame.JOYAXISMOTION,
+    ])
+
 #
 # Set up the game screen
 #
 screen = pygame.display.set_mode((800, 600))
 pygame.display.set_caption("Breaking Bricks")
 
+#
+# The screen does not change size during the game, so grab its rect once for
+# all the layout calculations below.
+#
+screen_rect = screen.get_rect()
+
+#
+# Set up the scoreboard items that need the screen
+#
+Tokens.init(screen)
+
 #
 # Define desired frame rate in frames per second (fps)
 # Then calculate how many milliseconds per frame (mpf) would correspond to it
 # if the frame rate were hit exactly each time.
 #
+# The game elements are always updated in fixed steps of mpf milliseconds,
+# regardless of how long each frame actually took, so that the game plays
+# the same even if the real frame rate varies. If frames take longer than
+# mpf, more than one step is run before the next frame is drawn. To keep a
+# very long frame (e.g. when the window is being dragged) from causing a
+# burst of catch up steps, no more than max_frame_ms of time is simulated
+# for any one frame.
+#
 fps = 55
 mpf = (1 / fps) * 1000
+max_frame_ms = 250
 
 #
 # Check for joysticks and controllers
@@ -60,12 +102,17 @@ controller_input = ControllerInput()
 #
 # These will be updated and drawn in the order they appear in the elements list
 #
+# Elements that never change once created, such as the overlay screens, are
+# kept in the static_elements list instead. These are only drawn, after
+# everything in the elements list, and are never updated.
+#
 elements = []
+static_elements = []
 
 # -------
 # paddle
 # -------
-paddle = Paddle(x=0, y=screen.get_height() - 100)
+paddle = Paddle(x=0, y=screen_rect.height - 100, screen=screen)
 elements.append(paddle)
 
 # -------
@@ -79,7 +126,7 @@ elements.append(paddle)
 sample_brick = Brick()
 brick_gap = int(sample_brick.width * 0.10)
 brick_rows = args.num_brick_rows if args.num_brick_rows else 5
-brick_cols = screen.get_width() // (sample_brick.width + brick_gap)
+brick_cols = screen_rect.width // (sample_brick.width + brick_gap)
 
 #
 # To even out the gap on the sides of the screen, the x gap on the last
@@ -93,28 +140,35 @@ brick_cols = screen.get_width() // (sample_brick.width + brick_gap)
 gapped_row_height = sample_brick.height + brick_gap
 gapped_brick_width = sample_brick.width + brick_gap
 block_set_width = (gapped_brick_width * brick_cols) - brick_gap
-side_gap = (screen.get_width() - block_set_width) // 2
+side_gap = (screen_rect.width - block_set_width) // 2
 top_gap = side_gap
 
 #
 # With the calculations out of the way, release the sample_brick
-# and create the set of bricks. These are saved in both the bricks
-# list and the elements list.
+# and create the set of bricks. These are saved in the bricks list and the
+# brick_grid. The grid lines up with the layout of the bricks so that each
+# brick sits in its own cell.
+#
+# Bricks never move, so they are not kept in the elements list to be updated
+# and drawn one by one. Instead, they are all drawn together as part of the
+# background by the brick_layer.
 #
 del sample_brick
 bricks = []
+brick_grid = BrickGrid(x=side_gap, y=top_gap, cell_width=gapped_brick_width, cell_height=gapped_row_height)
 for row in range(brick_rows):
     brick_y = top_gap + (row * gapped_row_height)
     for col in range(brick_cols):
         brick_x = side_gap + (col * gapped_brick_width)
         new_brick = Brick(x=brick_x, y=brick_y)
-        elements.append(new_brick)
         bricks.append(new_brick)
+        brick_grid.add(new_brick)
+brick_layer = BrickLayer(screen_rect.size, bricks)
 
 # -----
 # ball
 # -----
-ball = Ball(x=screen.get_rect().centerx, y=screen.get_rect().centery, paddle=paddle)
+ball = Ball(x=screen_rect.centerx, y=screen_rect.centery, paddle=paddle)
 elements.append(ball)
 
 #
@@ -122,84 +176,144 @@ elements.append(ball)
 #
 clock = pygame.time.Clock()
 game_over = False
+ball_in_play = True
 quit_game = False
 previous_brick_count = len(bricks)
-while not quit_game:
-    dt = clock.tick(fps)
+accumulated_ms = 0.0
 
-    # Clear the screen
-    screen.fill((0, 0, 0))
-
-    all_events = pygame.event.get()
-
-    # Handle game level events
-    for event in all_events:
-        if args.show_all_events:
-            print(event)
-        if event.type == pygame.QUIT:
-            quit_game = True
-        if event.type == pygame.KEYDOWN and event.key == pygame.K_TAB:
-            show_controller_status = not show_controller_status
-
-    # Update the elements, including element level events
-    for element in elements:
-        element.update(dt=dt, events=all_events, screen=screen)
-
-    # Check for and handle collisions between objects
-    for element in [e for e in elements if e.collidable]:
-        other_elements = [e for e in elements if e is not element and e.collidable]
-        elements_collided_with_indexes = element.collidelistall(other_elements)
-        for element_collided_with_index in elements_collided_with_indexes:
-            element.collided_with(other_elements[element_collided_with_index])
+#
+# The element level events that have not been passed to the elements yet,
+# sorted by type. If no steps run on a frame, that frame's events are kept
+# here until the next step that does run.
+#
+element_events = {}
+while not quit_game:
+    accumulated_ms += min(clock.tick(fps), max_frame_ms)
 
     #
-    # Remove any bricks that were hit
+    # Sort this frame's events by type in a single pass, so that the code
+    # below, and any element that cares about events, can go straight to the
+    # types it needs rather than scanning every event.
     #
-    # Note that clearing the bricks_to_delete at the end is not technically
-    # needed because it will get cleared on the next iteration. However, it
-    # feels cleaner to explicitly free the last references to the now deleted
-    # bricks rather than let it happen in the future as a side effect.
+    # Getting the events is also what has pygame refresh the keyboard and
+    # joystick state that the ControllerInput reads, so this is done right
+    # before the elements are updated, after the clock.tick() wait, so that
+    # the elements react to the freshest input possible. The game level
+    # events are not handled until after the updates for the same reason.
     #
-    bricks_to_delete = []
-    for brick in bricks:
-        if brick.was_hit:
-            bricks_to_delete.append(brick)
-    for brick in bricks_to_delete:
-        bricks.remove(brick)
-        elements.remove(brick)
-    bricks_to_delete = []
+    events = pygame.event.get()
+    if show_all_events:
+        for event in events:
+            print(event)
+    events_by_type = {}
+    for event in events:
+        events_by_type.setdefault(event.type, []).append(event)
+    if element_events:
+        for event_type, typed_events in events_by_type.items():
+            element_events.setdefault(event_type, []).extend(typed_events)
+    else:
+        element_events = events_by_type
 
     #
-    # Check if there are _now_ no more bricks, which means that the screen was
-    # cleared in this frame.
+    # Run as many fixed mpf steps of the game as there has been time for
+    # since the last step. Any time left over is carried on to the next frame.
     #
-    if len(bricks) == 0 and previous_brick_count != 0:
-        # Add the screen cleared bonus to the score and the tokens
-        score.screen_cleared(ball.velocity)
-        Tokens.add(1)
+    while accumulated_ms >= mpf:
+        accumulated_ms -= mpf
+
+        #
+        # Update the elements, including element level events. The events are
+        # passed as a dict of lists of events, keyed by event type. Each event
+        # is only passed on once, on the first step that runs after it came
+        # in, so any further steps on the same frame get no events.
+        #
+        for element in elements:
+            element.update(dt=mpf, events=element_events, screen=screen)
+        element_events = {}
+
+        #
+        # Check for and handle collisions between objects
+        #
+        # The ball is the only element that moves into other elements, so only
+        # it is checked, and only against the paddle and the bricks near it.
+        # The elements the ball hit react first so that, for example, a brick
+        # is scored with the speed of the ball before the ball bounces off it.
+        #
+        if ball_in_play:
+            other_elements = [paddle] + brick_grid.bricks_near(ball)
+            elements_collided_with = [other_elements[i] for i in ball.collidelistall(other_elements)]
+            for element_collided_with in elements_collided_with:
+                element_collided_with.collided_with(ball)
+            for element_collided_with in elements_collided_with:
+                ball.collided_with(element_collided_with)
+
+        #
+        # Remove any bricks that were hit
+        #
+        # This is done in a single pass over the bricks, keeping the ones that
+        # were not hit, rather than removing each hit brick from the list one
+        # at a time, which would search the list again for every brick.
+        #
+        remaining_bricks = []
+        for brick in bricks:
+            if brick.was_hit:
+                brick_grid.remove(brick)
+                brick_layer.remove(brick)
+            else:
+                remaining_bricks.append(brick)
+        bricks[:] = remaining_bricks
+
+        #
+        # Check if there are _now_ no more bricks, which means that the screen was
+        # cleared in this step.
+        #
+        if len(bricks) == 0 and previous_brick_count != 0:
+            # Add the screen cleared bonus to the score and the tokens
+            ball_vx, ball_vy = ball.velocity_components
+            score.screen_cleared(ball_vx, ball_vy)
+            Tokens.add(1)
+
+            # Remove the ball and display the "You Won!" screen
+            # TODO: Add multiple levels instead of stopping after the first level is cleared
+            elements.remove(ball)
+            ball_in_play = False
+            static_elements.append(OverlayScreen("You Won!", screen))
+
+        previous_brick_count = len(bricks)
+
+        #
+        # Check if the player just ran out of tokens. If so, then that is game
+        # over. This is checked after every step so that a ball lost in one
+        # step cannot be served again in a later step of the same frame.
+        #
+        if not game_over and Tokens.num_tokens <= 0:
+            game_over = True
+            elements.remove(ball)
+            ball_in_play = False
+            static_elements.append(OverlayScreen("Game Over", screen))
 
-        # Remove the ball and display the "You Won!" screen
-        # TODO: Add multiple levels instead of stopping after the first level is cleared
-        elements.remove(ball)
-        elements.append(OverlayScreen("You Won!", screen))
+    # Handle game level events
+    if QUIT in events_by_type:
+        quit_game = True
+    for event in events_by_type.get(KEYDOWN, ()):
+        if event.key == K_TAB:
+            show_controller_status = not show_controller_status
 
-    previous_brick_count = len(bricks)
+    #
+    # Clear the screen by drawing the background, which already has all the
+    # bricks on it
+    #
+    brick_layer.draw(screen)
 
     # Draw the scoreboard items
     Tokens.draw(screen)
     score.draw(screen)
 
-    #
-    # Check if the player just ran out of tokens. If so, then that is game over
-    #
-    if not game_over and Tokens.num_tokens <= 0:
-        game_over = True
-        elements.remove(ball)
-        elements.append(OverlayScreen("Game Over", screen))
-
     # Draw the elements
     for element in elements:
         element.draw(screen)
+    for element in static_elements:
+        element.draw(screen)
 
     # Draw any debug elements
     if show_controller_status:
@@ -17,7 +17,6 @@ import math
 import pygame
 from pygame import Surface
 from pygame.color import Color
-from pygame.math import Vector2
 
 _FONT_NAME = "Arial"
 FONT_SIZE = 24
@@ -37,8 +36,29 @@ _SPEED_FACTOR is the sqrt(1000) to make the speed value used for the score,
 more or less, in the pixels per second range.
 """
 
+_SCREEN_CLEARED_BASE_VALUE = 100
+
+_SCREEN_CLEARED_FACTOR = _SPEED_FACTOR * _SCREEN_CLEARED_BASE_VALUE
+"""
+The _SPEED_FACTOR and the base value for clearing the screen multiplied
+together ahead of time, since neither of them ever changes.
+"""
+
 _score = 0
 
+_text = None
+"""
+The score rendered as text, ready to be blitted on to the screen. Rendering
+text is slow compared to blitting it, so this is only done again when the
+score changes, which _update() signals by setting this back to None.
+"""
+
+_text_position = (0, 0)
+"""
+Where the top left corner of _text goes on the screen. The position depends
+on the size of the text, so it is worked out again whenever _text is.
+"""
+
 
 def draw(screen: Surface):
     """
@@ -52,13 +72,17 @@ def draw(screen: Surface):
     if not hasattr(draw, "font"):
         draw.font = pygame.font.SysFont(_FONT_NAME, FONT_SIZE, bold=True)
 
-    text = draw.font.render(f"{_score:,}", True, _TEXT_COLOR)
-    text_rect = text.get_rect()
-    text_rect.bottomright = (screen.get_width() - text_rect.height, screen.get_height() - text_rect.height)
-    screen.blit(text, text_rect)
+    global _text, _text_position
+    if _text is None:
+        _text = draw.font.render(f"{_score:,}", True, _TEXT_COLOR)
+        text_rect = _text.get_rect()
+        text_rect.bottomright = (screen.get_width() - text_rect.height, screen.get_height() - text_rect.height)
+        _text_position = text_rect.topleft
+
+    screen.blit(_text, _text_position)
 
 
-def _update(base_value: int, ball_velocity: Vector2):
+def _update(factor: float, ball_vx: float, ball_vy: float):
     """
     Add points to the score for various game events. This function is
     intended to be used internally and is called by the other scoring event
@@ -67,38 +91,46 @@ def _update(base_value: int, ball_velocity: Vector2):
     This code makes sure that the score goes up by at least 1 point when
     called regardless of how the math works out.
 
-    :param base_value: The base value for the event.
-    :param ball_velocity: The Vector2 velocity of the ball at the time the
-                           event. The faster the ball, the higher the score.
+    :param factor: The base value for the event already multiplied by the
+                    _SPEED_FACTOR.
+    :param ball_vx: The x component of the velocity of the ball at the time
+                    of the event.
+    :param ball_vy: The y component of the velocity of the ball at the time
+                    of the event. The faster the ball, the higher the score.
     """
-    global _score
+    global _score, _text
 
     #
-    # Use magnitude_squared() instead of magnitude() because it is more
-    # efficient and will be magnified more anyway.
+    # Use the squared magnitude of the velocity instead of the magnitude
+    # because it is more efficient and will be magnified more anyway. It is
+    # worked out directly from the components rather than building a Vector2.
     #
-    _score += max(1, int(_SPEED_FACTOR * ball_velocity.magnitude_squared() * base_value))
+    _score += max(1, int(factor * (ball_vx * ball_vx + ball_vy * ball_vy)))
+    _text = None
 
 
-def brick_destroyed(base_brick_value: int, ball_velocity: Vector2):
+def brick_destroyed(base_brick_value: int, ball_vx: float, ball_vy: float):
     """
     Add points to the score for destroying a brick.
 
     :param base_brick_value: The base value for a brick. Typically, this is
                                 1 for normal bricks, qnd 5 or 10 for "special"
                                 bricks.
-    :param ball_velocity: The Vector2 velocity of the ball at the time the
-                            brick was destroyed. The faster the ball, the
-                            higher the score.
+    :param ball_vx: The x component of the velocity of the ball at the time
+                    the brick was destroyed.
+    :param ball_vy: The y component of the velocity of the ball at the time
+                    the brick was destroyed. The faster the ball, the
+                    higher the score.
     """
-    _update(base_brick_value, ball_velocity)
+    _update(_SPEED_FACTOR * base_brick_value, ball_vx, ball_vy)
 
 
-def screen_cleared(ball_velocity: Vector2):
+def screen_cleared(ball_vx: float, ball_vy: float):
     """
     Add points to the score for clearing the screen. The points are adjusted
     based on the speed of the ball at the time the screen is cleared.
 
-    :param ball_velocity:
+    :param ball_vx:
+    :param ball_vy:
     """
-    _update(100, ball_velocity)
+    _update(_SCREEN_CLEARED_FACTOR, ball_vx, ball_vy)